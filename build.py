@@ -0,0 +1,23 @@
+"""Optionally compiles the parser module ahead of time with mypyc.
+
+Running `python build.py` produces a compiled extension module next to
+src/parser.py, which python then prefers over the pure source on import.
+The parser works exactly the same without this step, just slower, so
+mypyc is only a build-time dependency.
+"""
+
+import subprocess
+import sys
+
+
+def main() -> None:
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        sys.exit("mypyc is not installed, run 'pip install mypy' to get it.")
+
+    sys.exit(subprocess.call([sys.executable, "-m", "mypyc", "src/parser.py"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,22 @@
 import logging
+import os
+from logging.handlers import MemoryHandler
 
-logging.basicConfig(
-    level=logging.INFO,
-    filename=f"log.log",
-    filemode="w",
-    format="%(asctime)s - %(levelname)s - %(funcName)s - %(message)s",
-)
\ No newline at end of file
+logger = logging.getLogger("ccparser")
+
+if os.environ.get("CCPARSER_LOG"):
+    _file_handler = logging.FileHandler("log.log", mode="w")
+    _file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(funcName)s - %(message)s")
+    )
+    logger.setLevel(logging.INFO)
+    # buffer records in memory so INFO lines dont flush to the file per-record,
+    # errors flush the buffer immediately
+    logger.addHandler(
+        MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_file_handler)
+    )
+else:
+    # logging is dead weight for a normal run, raising the level to CRITICAL
+    # also lets the isEnabledFor guards skip their work entirely
+    logger.setLevel(logging.CRITICAL)
+    logger.addHandler(logging.NullHandler())
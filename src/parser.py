@@ -1,30 +1,34 @@
 import json
+import logging
+import mmap
 import os
-from pathlib import Path
-
-from .log import logging as lg
-
-
-class CCParser:
-    """A helper class that provides the ability to take deprecated cc v5
-    settings and parse them into the new config format of v6.
-
-    Attributes
-    ----------
-    SCHEMA_FILES :class:`list[str]`:
-        A list of expected schema files needed to parse the data
-
-    V5_TO_PARSE_FILES :class:`list[str]`:
-        A list of expected files to be parsed, rgb.json will be discarded
-
-
-    PARSE_MAPPING :class:`dict[str, str]`:
-        A dictionary mapping new keys to their equivalent in v5
-    """
-
-    SCHEMA_FILES = ["settings", "skills", "keybinds", "altcycler"]
-    V5_TO_PARSE_FILES = ["settings", "customrotation", "acrc", "rgb"]
-    PARSE_MAPPING: dict[str, str] = {
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None
+
+from .log import logger as lg
+
+# the process umask, read once at import since os.umask is process-global
+# and the output writes run concurrently
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# read-only mapping of new v6 keys to their deprecated v5 equivalent, kept at
+# module scope so the hot helpers reach it with a single global load instead
+# of an attribute walk per access
+_PARSE_MAPPING = MappingProxyType(
+    {
         "selected_character": "current_char",
         "main_character": "main_char_position",
         "allow_potions": "use_potions",
@@ -61,22 +65,94 @@ class CCParser:
         "aid_research": "include_guild",
         "priority": "skill_priorities",
     }
+)
+_PARSE_MAPPING_VALUES_TO_KEYS = MappingProxyType(
+    {v: k for k, v in _PARSE_MAPPING.items()}
+)
+
+
+class CCParser:
+    """A helper class that provides the ability to take deprecated cc v5
+    settings and parse them into the new config format of v6.
+
+    Attributes
+    ----------
+    SCHEMA_FILES :class:`list[str]`:
+        A list of expected schema files needed to parse the data
+
+    V5_TO_PARSE_FILES :class:`list[str]`:
+        A list of expected files to be parsed, rgb.json will be discarded
+
+
+    PARSE_MAPPING :class:`dict[str, str]`:
+        A dictionary mapping new keys to their equivalent in v5
+    """
+
+    SCHEMA_FILES = ["settings", "skills", "keybinds", "altcycler"]
+    V5_TO_PARSE_FILES = ["settings", "customrotation", "acrc", "rgb"]
+    V6_OUTPUT_FILES = ["settings", "skills", "keybinds", "altcycler"]
+    NON_PRESET_KEYS = frozenset(("global_keys", "chaos", "discord", "altcycler"))
+    SETTINGS_STREAM_SIZE = 8 * 1024 * 1024
+    PARSE_MAPPING = _PARSE_MAPPING
+    PARSE_MAPPING_VALUES_TO_KEYS = _PARSE_MAPPING_VALUES_TO_KEYS
+
+    rotation_data: dict[str, dict]
+    settings_data: dict[str, dict]
+    altcycler_data: dict[str, dict]
+    rgb_data: dict[str, dict]
+
+    skills_schema: dict[str, dict]
+    settings_schema: dict[str, dict]
+    altcycler_schema: dict[str, dict]
+    keybinds_schema: dict[str, str]
 
     def __init__(self) -> None:
         self._ensure_files_present()
-        self._load_files_to_parse()
-        self._load_schema_files()
+        self._load_files()
+        self._build_schema_keysets()
+        self._build_preset_skill_plan()
         self._create_parsed_data()
 
     def __call__(self) -> None:
-        self._wipe_output_folder()
-
         self._ensure_preset_completeness()
-        self.parse_settings()
-        self.parse_presets()
-        self.parse_keybinds()
-        self.parse_altcycler()
-        self._save_parsed_files()
+
+        # each output is handed to the pool as soon as its data is final,
+        # so the writes overlap with the remaining parse work
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.parse_settings()
+            self.parse_presets()
+            # the presets write into the settings data, so it may only be
+            # serialized once parse_presets has returned
+            futures = [
+                executor.submit(
+                    self._dump_json, self.parsed_settings_data, "output/settings.json"
+                ),
+                executor.submit(
+                    self._dump_json, self.parsed_rotation_data, "output/skills.json"
+                ),
+            ]
+            self.parse_keybinds()
+            futures.append(
+                executor.submit(
+                    self._dump_json, self.parsed_keybinds, "output/keybinds.json"
+                )
+            )
+            self.parse_altcycler()
+            futures.append(
+                executor.submit(
+                    self._dump_json, self.parsed_altcycler_data, "output/altcycler.json"
+                )
+            )
+            for future in futures:
+                future.result()
+
+        self._remove_stale_outputs()
+
+    @cached_property
+    def preset_names(self) -> frozenset[str]:
+        """The names of all presets in the settings data, computed once
+        since both the completeness check and the preset parsing need it."""
+        return frozenset(self.settings_data.keys() - self.NON_PRESET_KEYS)
 
     def parse_keybinds(self) -> None:
         """Parses all the keybinds into the new keybinds.json.
@@ -93,21 +169,23 @@ class CCParser:
         lg.info("Parsing keybinds...")
         data_to_parse = self.settings_data["global_keys"]
         schema = self.keybinds_schema
+        schema_keys = self._schema_keysets["keybinds"]
 
-        self._add_retained_keys(self.parsed_keybinds, data_to_parse, schema)
-        self._add_parse_map_keys(self.parsed_keybinds, data_to_parse, schema)
+        self._add_retained_keys(self.parsed_keybinds, data_to_parse, schema_keys)
+        self._add_parse_map_keys(self.parsed_keybinds, data_to_parse, schema_keys)
 
         lg.info("Adding static values...")
         mouse_key = data_to_parse["move_with"].split("-")[0]
         self.parsed_keybinds["primary_mouse"] = mouse_key
 
-        lg.info(
-            f"Parsing 'keybinds' complete. "
-            f"Total keys: {len(self.parsed_keybinds)}, schema keys: {len(schema.keys())}. "
-            f"Keys not parsed: {set(schema.keys()).difference(self.parsed_keybinds.keys())}"
-        )
-        with open(f"output/keybinds.json", "w") as f:
-            json.dump(self.parsed_keybinds, f, indent=4)
+        if lg.isEnabledFor(logging.INFO):
+            lg.info(
+                "Parsing 'keybinds' complete. "
+                "Total keys: %d, schema keys: %d. Keys not parsed: %s",
+                len(self.parsed_keybinds),
+                len(schema),
+                schema_keys.difference(self.parsed_keybinds.keys()),
+            )
 
     def parse_settings(self) -> None:
         """Parses all the global keys from a v5 config into the different
@@ -126,16 +204,21 @@ class CCParser:
 
         for section in ["global", "chaos", "discord", "altcycler"]:
             schema = self.settings_schema[section]
+            schema_keys = self._schema_keysets[f"settings.{section}"]
             parsed = self.parsed_settings_data[section] = {}
 
-            self._add_retained_keys(parsed, to_parse, schema)
-            self._add_parse_map_keys(parsed, to_parse, schema)
+            self._add_retained_keys(parsed, to_parse, schema_keys)
+            self._add_parse_map_keys(parsed, to_parse, schema_keys)
 
-            lg.info(
-                f"Parsing '{section}' complete. "
-                f"Total keys: {len(parsed)}, schema keys: {len(schema.keys())}. "
-                f"Keys not parsed: {set(schema.keys()).difference(parsed.keys())}"
-            )
+            if lg.isEnabledFor(logging.INFO):
+                lg.info(
+                    "Parsing '%s' complete. "
+                    "Total keys: %d, schema keys: %d. Keys not parsed: %s",
+                    section,
+                    len(parsed),
+                    len(schema),
+                    schema_keys.difference(parsed.keys()),
+                )
 
     def parse_presets(self) -> None:
         """Parses all presets in the v5 file into new presets in v6,
@@ -149,25 +232,34 @@ class CCParser:
         find any new versions of deprecated keys in the data to parse and once
         again add the value to that key.
         """
-        all_presets = set(self.settings_data.keys()).difference(
-            ["global_keys", "chaos", "discord", "altcycler"]
-        )
-
-        for preset in all_presets:
-            self._parse_preset_settings(preset)
-            self._parse_preset_skills(preset)
+        if not self._stream_presets:
+            # iterate the settings data rather than the preset name set so
+            # the output order stays the same as the input file
+            for preset, to_parse in self.settings_data.items():
+                if preset not in self.NON_PRESET_KEYS:
+                    self._parse_preset_settings(preset, to_parse)
+                    self._parse_preset_skills(preset, to_parse)
+            return
+
+        # re-stream the settings file so only one preset body is ever
+        # held in memory alongside its parsed counterpart
+        with open("input/settings.json", "rb") as f:
+            for preset, to_parse in ijson.kvitems(f, "", use_float=True):
+                if preset not in self.NON_PRESET_KEYS:
+                    self._parse_preset_settings(preset, to_parse)
+                    self._parse_preset_skills(preset, to_parse)
 
     def parse_altcycler(self) -> None:
         """Parses all characters in the altcycler settings on v5 into
         the new altcycler settings of v6"""
-        schema = self.altcycler_schema["c1"]
+        schema_keys = self._schema_keysets["altcycler.c1"]
 
         for c, v in self.altcycler_data.items():
             parsed = self.parsed_altcycler_data[c] = {}
-            self._add_retained_keys(parsed, v, schema)
-            self._add_parse_map_keys(parsed, v, schema)
+            self._add_retained_keys(parsed, v, schema_keys)
+            self._add_parse_map_keys(parsed, v, schema_keys)
 
-    def _parse_preset_settings(self, preset: str) -> None:
+    def _parse_preset_settings(self, preset: str, to_parse: dict) -> None:
         """Parses all preset settings in settings.json into the new v6 preset
         from an existing v5 preset.
 
@@ -175,21 +267,39 @@ class CCParser:
         ----------
         preset :class:`preset`:
             The preset to be parsed
+
+        to_parse :class:`dict`:
+            The settings data of the preset
         """
         schema = self.settings_schema["SL"]
-        to_parse = self.settings_data[preset]
-        parsed = self.parsed_settings_data[preset] = {}
-
-        self._add_retained_keys(parsed, to_parse, schema)
-        self._add_parse_map_keys(parsed, to_parse, schema)
+        schema_keys = self._schema_keysets["settings.SL"]
 
-        lg.info(
-            f"Parsing '{preset}' complete. "
-            f"Total keys: {len(parsed)}, schema keys: {len(schema.keys())}. "
-            f"Keys not parsed: {set(schema.keys()).difference(parsed.keys())}"
+        # presets mostly retain their keys, so instead of two helper passes
+        # the common case collapses into one C-level comprehension with a
+        # small overlay for the renamed keys
+        parsed = self.parsed_settings_data[preset] = {
+            k: v for k, v in to_parse.items() if k in schema_keys
+        }
+        parsed.update(
+            {
+                new_key: v
+                for k, v in to_parse.items()
+                if (new_key := _PARSE_MAPPING_VALUES_TO_KEYS.get(k)) is not None
+                and new_key in schema_keys
+            }
         )
 
-    def _parse_preset_skills(self, preset: str) -> None:
+        if lg.isEnabledFor(logging.INFO):
+            lg.info(
+                "Parsing '%s' complete. "
+                "Total keys: %d, schema keys: %d. Keys not parsed: %s",
+                preset,
+                len(parsed),
+                len(schema),
+                schema_keys.difference(parsed.keys()),
+            )
+
+    def _parse_preset_skills(self, preset: str, settings_to_parse: dict) -> None:
         """Parses all preset settings in customrotation.json into the new v6 preset
         from an existing v5 preset.
 
@@ -197,6 +307,9 @@ class CCParser:
         ----------
         preset :class:`preset`:
             The preset to be parsed
+
+        settings_to_parse :class:`dict`:
+            The settings data of the preset, needed for the awakening keys
         """
         schema = self.skills_schema["SL"]
         to_parse = self.rotation_data[preset]
@@ -204,31 +317,37 @@ class CCParser:
 
         rgbs = self.rgb_data[preset]
 
-        for idx, (k, v) in enumerate(self.skills_schema["SL"].items(), start=1):
-            parsed = self.parsed_rotation_data[preset][k] = {}
-            if isinstance(v, dict):
-                self._add_retained_keys(parsed, to_parse, v)
-                if idx < 9:
-                    parsed["rgb"] = rgbs[f"skill_{idx}"]
+        for k, skill_keys, rgb_key, fallback in self._preset_skill_plan:
+            if skill_keys is not None:
+                parsed = self.parsed_rotation_data[preset][k] = {}
+                self._add_retained_keys(parsed, to_parse, skill_keys)
+                if rgb_key is not None:
+                    parsed["rgb"] = rgbs[rgb_key]
             else:
-                try:
-                    self.parsed_rotation_data[preset][k] = self.rotation_data[preset][k]
-                except KeyError:
-                    self.parsed_rotation_data[preset][k] = self.rotation_data[preset][
-                        self.PARSE_MAPPING[k]
-                    ]
+                rotation = self.rotation_data[preset]
+                self.parsed_rotation_data[preset][k] = rotation[
+                    k if k in rotation else fallback
+                ]
 
         awk = self.parsed_rotation_data[preset]["awakening"]
-        self._add_retained_keys(awk, self.settings_data[preset], schema["awakening"])
-
-        lg.info(
-            f"Parsing '{preset}' complete. "
-            f"Total keys: {len(self.parsed_rotation_data[preset])}, schema keys: {len(schema.keys())}. "
-            f"Keys not parsed: {set(schema.keys()).difference(self.parsed_rotation_data[preset].keys())}"
+        self._add_retained_keys(
+            awk, settings_to_parse, self._schema_keysets["skills.awakening"]
         )
 
+        if lg.isEnabledFor(logging.INFO):
+            lg.info(
+                "Parsing '%s' complete. "
+                "Total keys: %d, schema keys: %d. Keys not parsed: %s",
+                preset,
+                len(self.parsed_rotation_data[preset]),
+                len(schema),
+                schema.keys() - self.parsed_rotation_data[preset].keys(),
+            )
+
     @staticmethod
-    def _add_retained_keys(new_dict: dict, to_parse: dict, schema: dict) -> None:
+    def _add_retained_keys(
+        new_dict: dict, to_parse: dict, schema_keys: frozenset[str]
+    ) -> None:
         """Adds all retained keys to the new dictionary that are still in the
         dictionary to parse and are part of the dictionary schema.
 
@@ -240,16 +359,17 @@ class CCParser:
         to_parse :class:`dict`:
             The dictionary containing the data to be parsed
 
-        schema :class:`dict`:
-            The dictionary containing the schema for the new parsed data
+        schema_keys :class:`frozenset[str]`:
+            The precomputed keys of the schema for the new parsed data
         """
         lg.info("Checking for retained keys...")
-        for k, v in to_parse.items():
-            if k in schema.keys():
-                lg.info(f"Found retained key '{k}'")
-                new_dict[k] = v
+        retained = {k: v for k, v in to_parse.items() if k in schema_keys}
+        new_dict.update(retained)
+        lg.info("Found %d retained keys", len(retained))
 
-    def _add_parse_map_keys(self, new_dict: dict, to_parse: dict, schema: dict) -> None:
+    def _add_parse_map_keys(
+        self, new_dict: dict, to_parse: dict, schema_keys: frozenset[str]
+    ) -> None:
         """Adds all parse mapped keys to the new dictionary that are still in the
         dictionary to parse and are part of the dictionary schema.
 
@@ -261,14 +381,19 @@ class CCParser:
         to_parse :class:`dict`:
             The dictionary containing the data to be parsed
 
-        schema :class:`dict`:
-            The dictionary containing the schema for the new parsed data
+        schema_keys :class:`frozenset[str]`:
+            The precomputed keys of the schema for the new parsed data
         """
         lg.info("Checking for new keys in parse map...")
-        for k, v in self.PARSE_MAPPING.items():
-            if k in schema.keys() and v in to_parse.keys():
-                lg.info(f"Found new version of deprecated key '{v}': '{k}'")
-                new_dict[k] = to_parse[v]
+        deprecated_to_new = _PARSE_MAPPING_VALUES_TO_KEYS
+        # walking the data keeps insertion order deterministic and replaces
+        # the full mapping scan with one lookup per visited key
+        for old_key, value in to_parse.items():
+            new_key = deprecated_to_new.get(old_key)
+            if new_key is None or new_key not in schema_keys:
+                continue
+            lg.info("Found new version of deprecated key '%s': '%s'", old_key, new_key)
+            new_dict[new_key] = value
 
     def _ensure_preset_completeness(self) -> None:
         """Makes sure that all presets in the settings.json are also present
@@ -279,12 +404,10 @@ class CCParser:
         `LookupError`
             When one or more presets are only present in either file
         """
-        all_presets = set(self.settings_data.keys()).difference(
-            ["global_keys", "chaos", "discord", "altcycler"]
-        )
+        all_presets = self.preset_names
         rotation_diff = all_presets.difference(self.rotation_data.keys())
         skill_diff = all_presets.difference(self.rgb_data.keys())
-        if rotation_diff or rotation_diff:
+        if rotation_diff or skill_diff:
             raise LookupError(
                 f"FATAL! Preset(s) {skill_diff or rotation_diff} is only present in one file!"
             )
@@ -292,46 +415,183 @@ class CCParser:
     def _ensure_files_present(self) -> None:
         """Validates that all required files are present.
 
+        Each folder is scanned once and the expected files are checked
+        against the result, rather than stat-ing every file individually.
+
         Raises
         ------
         `FileNotFoundError`
             When an expected file could not be found
         """
+        present = self._list_files("schema")
         for f in self.SCHEMA_FILES:
-            if not Path(f"schema/{f}.json").exists():
+            if f"{f}.json" not in present:
                 raise FileNotFoundError(f"FATAL: Missing schema '{f}'")
 
+        present = self._list_files("input")
         for f in self.V5_TO_PARSE_FILES:
-            if not Path(f"input/{f}.json").exists():
+            if f"{f}.json" not in present:
                 raise FileNotFoundError(f"FATAL: Missing file to parse '{f}'")
 
-    def _load_files_to_parse(self) -> None:
-        """Loads all files to be parsed"""
-        with open("input/customrotation.json") as f:
-            self.rotation_data: dict[str, dict] = json.load(f)
+    @staticmethod
+    def _list_files(folder: str) -> set[str]:
+        """Lists the names of all files in the given folder, a missing
+        folder is treated the same as an empty one.
+
+        Parameters
+        ----------
+        folder :class:`str`:
+            The folder to list the files of
+        """
+        try:
+            return {e.name for e in os.scandir(folder) if e.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    @staticmethod
+    def _load_json(path: str) -> dict:
+        """Loads a json file, using orjson when available as it decodes
+        significantly faster than the stdlib.
 
-        with open("input/settings.json") as f:
-            self.settings_data: dict[str, dict] = json.load(f)
+        Parameters
+        ----------
+        path :class:`str`:
+            The path of the json file to load
+        """
+        if orjson is not None:
+            # memory-map the file and decode straight from the buffer, that
+            # way the raw contents are never copied into an extra bytes object
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                        mm.madvise(mmap.MADV_WILLNEED)
+                    return orjson.loads(memoryview(mm))
+
+        with open(path) as f:
+            return json.load(f)
 
-        with open("input/acrc.json") as f:
-            self.altcycler_data: dict[str, dict] = json.load(f)
+    @staticmethod
+    def _dump_json(data: dict, path: str) -> None:
+        """Writes a dictionary to a json file pretty-printed, using orjson
+        when available so the indentation happens at C level and the file
+        is written with a single buffered write.
 
-        with open("input/rgb.json") as f:
-            self.rgb_data: dict[str, dict] = json.load(f)
+        The data is first written to a temporary sibling file which then
+        atomically replaces the destination, so a crash mid-write can never
+        leave a half-written config behind.
 
-    def _load_schema_files(self) -> None:
-        """Loads all files to be parsed"""
-        with open("schema/skills.json") as f:
-            self.skills_schema: dict[str, dict] = json.load(f)
+        Parameters
+        ----------
+        data :class:`dict`:
+            The data to be written
 
-        with open("schema/settings.json") as f:
-            self.settings_schema: dict[str, dict] = json.load(f)
+        path :class:`str`:
+            The path of the json file to write to
+        """
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=4).encode()
+
+        directory, name = os.path.split(path)
+        f = tempfile.NamedTemporaryFile(
+            "wb", dir=directory or ".", prefix=f".{name}.", delete=False
+        )
+        try:
+            with f:
+                f.write(payload)
+            # tempfiles are created owner-only, restore the permissions a
+            # regular open() would have given the file
+            os.chmod(f.name, 0o666 & ~_UMASK)
+            os.replace(f.name, path)
+        except BaseException:
+            os.unlink(f.name)
+            raise
+
+    def _load_files(self) -> None:
+        """Loads all files to be parsed aswell as their schemas.
+
+        The files are independent of each other and both the reads and the
+        orjson decodes release the GIL, so loading them through a thread pool
+        overlaps the disk waits instead of paying for them back-to-back.
+        """
+        paths = {
+            "rotation_data": "input/customrotation.json",
+            "altcycler_data": "input/acrc.json",
+            "rgb_data": "input/rgb.json",
+            "skills_schema": "schema/skills.json",
+            "settings_schema": "schema/settings.json",
+            "altcycler_schema": "schema/altcycler.json",
+            "keybinds_schema": "schema/keybinds.json",
+        }
+        with ThreadPoolExecutor(max_workers=len(paths) + 1) as executor:
+            settings = executor.submit(self._load_settings)
+            for attr, data in zip(paths, executor.map(self._load_json, paths.values())):
+                setattr(self, attr, data)
+            self.settings_data = settings.result()
+
+    def _load_settings(self) -> dict[str, dict]:
+        """Loads the settings data to be parsed.
+
+        Settings files past `SETTINGS_STREAM_SIZE` are not held in memory
+        as a whole. Only the non-preset sections are kept and the preset
+        bodies are streamed one at a time by `parse_presets` instead, so
+        the memory footprint stays at a single preset no matter how many
+        a config contains. Requires ijson, otherwise the whole file is
+        loaded eagerly like any other.
+        """
+        path = "input/settings.json"
+        self._stream_presets = (
+            ijson is not None and os.path.getsize(path) >= self.SETTINGS_STREAM_SIZE
+        )
+        if not self._stream_presets:
+            return self._load_json(path)
+
+        # preset bodies are left empty on purpose, the keys alone are enough
+        # for the completeness check and the preset name set
+        data: dict[str, dict] = {}
+        with open(path, "rb") as f:
+            for key, value in ijson.kvitems(f, "", use_float=True):
+                data[key] = value if key in self.NON_PRESET_KEYS else {}
+        return data
+
+    def _build_schema_keysets(self) -> None:
+        """Precomputes the keys of each schema section as a frozenset.
+
+        The parse helpers test schema membership for every pair they visit,
+        so building the sets once up front avoids reconstructing the dict
+        key views inside the hot loops.
+        """
+        self._schema_keysets: dict[str, frozenset[str]] = {
+            "keybinds": frozenset(self.keybinds_schema),
+            "altcycler.c1": frozenset(self.altcycler_schema["c1"]),
+        }
+        for section, schema in self.settings_schema.items():
+            self._schema_keysets[f"settings.{section}"] = frozenset(schema)
+
+        for skill, skill_schema in self.skills_schema["SL"].items():
+            if isinstance(skill_schema, dict):
+                self._schema_keysets[f"skills.{skill}"] = frozenset(skill_schema)
 
-        with open("schema/altcycler.json") as f:
-            self.altcycler_schema: dict[str, dict] = json.load(f)
+    def _build_preset_skill_plan(self) -> None:
+        """Precomputes a parse plan for the skill schema.
 
-        with open("schema/keybinds.json") as f:
-            self.keybinds_schema: dict[str, str] = json.load(f)
+        The skill schema is the same for every preset, so the decisions that
+        only depend on its shape (nested skill dict vs. flat value, which
+        rgb slot belongs to a skill, which deprecated key to fall back to)
+        are made once here instead of being re-branched for every preset in
+        `_parse_preset_skills`.
+        """
+        plan: list[tuple[str, frozenset[str] | None, str | None, str]] = []
+        for idx, (k, v) in enumerate(self.skills_schema["SL"].items(), start=1):
+            if isinstance(v, dict):
+                rgb_key = f"skill_{idx}" if idx < 9 else None
+                plan.append((k, self._schema_keysets[f"skills.{k}"], rgb_key, k))
+            else:
+                plan.append((k, None, None, _PARSE_MAPPING.get(k, k)))
+
+        self._preset_skill_plan = plan
 
     def _create_parsed_data(self) -> None:
         """Creates empty dictionaries to be populated with parsed data"""
@@ -340,19 +600,13 @@ class CCParser:
         self.parsed_keybinds: dict[str, str] = {}
         self.parsed_altcycler_data: dict[str, dict] = {}
 
-    def _save_parsed_files(self) -> None:
-        """Saves all settings to configs"""
-        destinations = {
-            "settings": self.parsed_settings_data,
-            "keybinds": self.parsed_keybinds,
-            "altcycler": self.parsed_altcycler_data,
-            "skills": self.parsed_rotation_data,
-        }
-        for file, var in destinations.items():
-            with open(f"output/{file}.json", "w") as f:
-                json.dump(var, f, indent=4)
-
-    def _wipe_output_folder(self) -> None:
-        filelist = [f for f in os.listdir("output") if f.endswith(".json")]
-        for f in filelist:
-            os.remove(os.path.join("output", f))
+    def _remove_stale_outputs(self) -> None:
+        """Removes any leftover json in the output folder that is not one
+        of the known destination files, aswell as temp files a crashed
+        earlier run may have left behind."""
+        expected = {f"{file}.json" for file in self.V6_OUTPUT_FILES}
+        for f in self._list_files("output"):
+            stale_json = f.endswith(".json") and f not in expected
+            stale_temp = any(f.startswith(f".{name}.") for name in expected)
+            if stale_json or stale_temp:
+                os.remove(os.path.join("output", f))